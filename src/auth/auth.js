@@ -1,9 +1,16 @@
 import bcrypt from 'bcrypt';
+import crypto from 'crypto';
 import jwt from 'jsonwebtoken';
 import { configOps } from '../database/db.js';
 
-const JWT_SECRET = process.env.JWT_SECRET || 'change-this-secret-in-production';
 const SALT_ROUNDS = 10;
+// Old built-in default and the .env.example placeholder; neither should sign tokens
+const PLACEHOLDER_SECRETS = [
+  'change-this-secret-in-production',
+  'change_this_to_a_random_secure_string_32_chars_minimum'
+];
+// Tokens we issue are a few hundred bytes; anything far larger is rejected before verification
+const MAX_TOKEN_LENGTH = 2048;
 
 // User roles
 export const ROLES = {
@@ -80,8 +87,40 @@ const ROLE_PERMISSIONS = {
   ]
 };
 
+let jwtSecret = null;
+
+// Resolve the JWT secret lazily so .env has been loaded by the time it is read
+function getJwtSecret() {
+  if (jwtSecret) {
+    return jwtSecret;
+  }
+  
+  const envSecret = process.env.JWT_SECRET;
+  if (envSecret && !PLACEHOLDER_SECRETS.includes(envSecret)) {
+    jwtSecret = envSecret;
+    return jwtSecret;
+  }
+  
+  if (envSecret) {
+    console.log('⚠️  JWT_SECRET is still set to the example value - ignoring it!');
+    console.log('⚠️  Using a generated secret instead. SET A REAL JWT_SECRET!');
+  }
+  
+  // No usable secret configured: generate one on first launch and keep it across restarts
+  jwtSecret = configOps.get('jwt_secret');
+  if (!jwtSecret) {
+    jwtSecret = crypto.randomBytes(32).toString('base64url');
+    configOps.set('jwt_secret', jwtSecret);
+    console.log('🔑 Generated new JWT secret (stored in database)');
+  }
+  
+  return jwtSecret;
+}
+
 // Initialize default admin user
 export async function initializeAuth() {
+  getJwtSecret();
+  
   const adminExists = configOps.get('admin_initialized');
   
   if (!adminExists) {
@@ -143,7 +182,7 @@ export async function authenticateUser(username, password) {
   // Generate JWT token
   const token = jwt.sign(
     { username: user.username, role: user.role },
-    JWT_SECRET,
+    getJwtSecret(),
     { expiresIn: '7d' }
   );
   
@@ -157,7 +196,7 @@ export async function authenticateUser(username, password) {
 // Verify JWT token
 export function verifyToken(token) {
   try {
-    return jwt.verify(token, JWT_SECRET);
+    return jwt.verify(token, getJwtSecret());
   } catch (error) {
     return null;
   }
@@ -177,6 +216,10 @@ export function requireAuth(req, res, next) {
     return res.status(401).json({ error: 'Authentication required' });
   }
   
+  if (token.length > MAX_TOKEN_LENGTH) {
+    return res.status(401).json({ error: 'Invalid token' });
+  }
+  
   const user = verifyToken(token);
   if (!user) {
     return res.status(401).json({ error: 'Invalid token' });
@@ -35,6 +35,12 @@ db.exec(`
   CREATE INDEX IF NOT EXISTS idx_logs_category ON logs(category);
 `);
 
+// Prepared once; every log call on the request path reuses it
+const insertLogStmt = db.prepare(`
+  INSERT INTO logs (timestamp, level, category, message, metadata, source, userId)
+  VALUES (?, ?, ?, ?, ?, ?, ?)
+`);
+
 // Core logger class
 class Logger {
   constructor(category = 'general') {
@@ -44,12 +50,7 @@ class Logger {
   // Log a message
   log(level, message, metadata = null, source = null, userId = null) {
     try {
-      const stmt = db.prepare(`
-        INSERT INTO logs (timestamp, level, category, message, metadata, source, userId)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-      `);
-      
-      stmt.run(
+      insertLogStmt.run(
         Date.now(),
         level,
         this.category,